@@ -5,15 +5,18 @@ This file sets up SQLAlchemy for async database operations.
 It handles connection pooling and session management.
 """
 
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import StaticPool
 import asyncio
+import logging
 from typing import AsyncGenerator
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create database engines
 # Async engine for main application
 async_engine = create_async_engine(
@@ -21,6 +24,13 @@ async_engine = create_async_engine(
     echo=settings.debug,  # Log SQL queries in debug mode
     pool_pre_ping=True,   # Verify connections before use
     pool_recycle=300,     # Recycle connections every 5 minutes
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    connect_args={
+        # Keep more prepared statements per connection so repeated queries
+        # skip the server-side parse/plan step
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    },
 )
 
 # Sync engine for migrations and admin tasks
@@ -81,8 +91,8 @@ async def test_connection():
     """Test if database connection is working"""
     try:
         async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
+            await session.execute(text("SELECT 1"))
             return True
     except Exception as e:
-        print(f"❌ Database connection failed: {e}")
+        logger.warning("Database connection failed: %s", e)
         return False
\ No newline at end of file
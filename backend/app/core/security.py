@@ -12,6 +12,9 @@ and ensures only authenticated users can access protected features.
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
 import jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -23,6 +26,15 @@ from app.core.config import settings
 # bcrypt is industry-standard for password hashing - it's slow on purpose to prevent brute force attacks
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Dedicated thread pool for bcrypt work
+# Hashing takes ~100ms+ of CPU, so running it inline in an async route would
+# freeze the event loop. A small bounded pool keeps a burst of logins from
+# piling up in (and starving) the default executor.
+password_executor = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="bcrypt"
+)
+
 # JWT token scheme for FastAPI
 # This tells FastAPI to look for "Authorization: Bearer <token>" headers
 security = HTTPBearer()
@@ -66,6 +78,39 @@ class PasswordManager:
             True if password is correct, False otherwise
         """
         return pwd_context.verify(plain_password, hashed_password)
+    
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Hash a password without blocking the event loop
+        
+        Use this from async code (routes, services) instead of hash_password.
+        
+        Args:
+            password: Plain text password from user
+            
+        Returns:
+            Hashed password safe to store in database
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_executor, PasswordManager.hash_password, password)
+    
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password without blocking the event loop
+        
+        Args:
+            plain_password: Password user entered
+            hashed_password: Hash stored in database
+            
+        Returns:
+            True if password is correct, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor, PasswordManager.verify_password, plain_password, hashed_password
+        )
 
 
 class JWTManager:
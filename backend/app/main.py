@@ -8,9 +8,10 @@ It sets up the API routes, middleware, and database connections.
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 import time
+import json
 import logging
 import asyncio
 
@@ -26,6 +27,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Monotonic reference point for uptime reporting (immune to wall-clock changes)
+START_TIME = time.monotonic()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -49,7 +53,7 @@ async def lifespan(app: FastAPI):
         else:
             logger.warning("⚠️ Database connection failed - running without database")
     except Exception as e:
-        logger.warning(f"⚠️ Database not available: {e} - running without database")
+        logger.warning("⚠️ Database not available: %s - running without database", e)
         logger.info("💡 To enable database features, start PostgreSQL with Docker: docker-compose up -d postgres")
     
     logger.info("✅ NovaStack API started successfully!")
@@ -88,30 +92,42 @@ app.include_router(api_router)
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Add response time header to all requests"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
+# Static payloads - settings don't change while the process runs,
+# so these are rendered to JSON bytes once instead of on every request
+ROOT_PAYLOAD = json.dumps({
+    "message": "Welcome to NovaStack API! 🚀",
+    "status": "running",
+    "version": "0.1.0",
+    "environment": "development" if settings.debug else "production",
+    "docs": "/docs",
+    "features": {
+        "database_types": ["postgresql", "mysql"],
+        "api_types": ["REST", "GraphQL"],
+        "auth": "JWT",
+        "storage": "MinIO (S3-compatible)",
+        "realtime": "WebSocket"
+    }
+}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+CONFIG_PAYLOAD = json.dumps({
+    "api_version": "0.1.0",
+    "debug_mode": settings.debug,
+    "cors_origins": settings.cors_origins,
+    "supported_databases": ["postgresql", "mysql"],
+    "jwt_expire_minutes": settings.jwt_expire_minutes
+}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 # Health check endpoints
 @app.get("/")
 async def root():
     """Root endpoint - shows API status and configuration"""
-    return {
-        "message": "Welcome to NovaStack API! 🚀",
-        "status": "running",
-        "version": "0.1.0",
-        "environment": "development" if settings.debug else "production",
-        "docs": "/docs",
-        "features": {
-            "database_types": ["postgresql", "mysql"],
-            "api_types": ["REST", "GraphQL"],
-            "auth": "JWT",
-            "storage": "MinIO (S3-compatible)",
-            "realtime": "WebSocket"
-        }
-    }
+    return Response(ROOT_PAYLOAD, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
@@ -120,7 +136,7 @@ async def health_check():
         "status": "healthy",
         "timestamp": time.time(),
         "version": "0.1.0",
-        "uptime": time.time(),  # Will be improved later with actual uptime
+        "uptime": time.monotonic() - START_TIME,  # Seconds since process start
         "services": {}
     }
     
@@ -139,19 +155,13 @@ async def health_check():
 @app.get("/config")
 async def get_config():
     """Get public configuration information (no secrets!)"""
-    return {
-        "api_version": "0.1.0",
-        "debug_mode": settings.debug,
-        "cors_origins": settings.cors_origins,
-        "supported_databases": ["postgresql", "mysql"],
-        "jwt_expire_minutes": settings.jwt_expire_minutes
-    }
+    return Response(CONFIG_PAYLOAD, media_type="application/json")
 
 # Global exception handler
 @app.exception_handler(500)
 async def internal_server_error_handler(request: Request, exc: Exception):
     """Handle internal server errors gracefully"""
-    logger.error(f"Internal server error: {exc}")
+    logger.error("Internal server error: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"message": "Internal server error occurred"}
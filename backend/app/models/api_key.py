@@ -8,6 +8,7 @@ Each project can have multiple API keys with different permissions.
 from sqlalchemy import Column, String, DateTime, ForeignKey, func, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
 import uuid
 
 from app.core.database import Base
@@ -56,7 +57,6 @@ class ApiKey(Base):
         """Check if API key has expired"""
         if not self.expires_at:
             return False
-        from datetime import datetime, timezone
         return datetime.now(timezone.utc) > self.expires_at
     
     @property
@@ -5,7 +5,7 @@ This model represents database projects created by users.
 Each project contains an isolated database (PostgreSQL or MySQL).
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -49,6 +49,14 @@ class Project(Base):
     owner = relationship("User", back_populates="projects")
     api_keys = relationship("ApiKey", back_populates="project", cascade="all, delete-orphan")
     
+    # Composite indexes for the per-owner access patterns
+    __table_args__ = (
+        # Name lookups within an owner (project names are unique per user)
+        UniqueConstraint("owner_id", "name"),
+        # Listing a user's projects newest-first without a sort step
+        Index("idx_projects_owner_created", "owner_id", created_at.desc()),
+    )
+    
     def __repr__(self):
         return f"<Project {self.name} ({self.database_type})>"
     
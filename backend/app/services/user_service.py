@@ -13,15 +13,23 @@ about how users should be created, authenticated, etc.
 
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, lambda_stmt, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException, status
-from datetime import datetime, timezone
 
 from app.models.user import User
 from app.models.auth import UserRegister, UserLogin, PasswordChange
 from app.core.security import PasswordManager, create_token_for_user
 from app.core.config import settings
 
+# Hot lookup statements, built once at import time
+# lambda_stmt lets SQLAlchemy skip rebuilding and re-keying the SELECT on every call
+_USER_BY_ID = lambda_stmt(lambda: select(User).where(User.id == bindparam("user_id")))  # /me, end of every login
+_CREDENTIALS_BY_EMAIL = lambda_stmt(
+    lambda: select(User.id, User.hashed_password, User.is_active).where(User.email == bindparam("email"))
+)  # Start of every login
+_HASH_BY_ID = lambda_stmt(lambda: select(User.hashed_password).where(User.id == bindparam("user_id")))  # Password changes
+
 
 class UserService:
     """Service class for user operations"""
@@ -35,20 +43,6 @@ class UserService:
         """
         self.db = db
     
-    async def get_user_by_email(self, email: str) -> Optional[User]:
-        """
-        Find a user by their email address
-        
-        Args:
-            email: User's email address
-            
-        Returns:
-            User object if found, None otherwise
-        """
-        stmt = select(User).where(User.email == email)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
-    
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """
         Find a user by their ID
@@ -59,8 +53,7 @@ class UserService:
         Returns:
             User object if found, None otherwise
         """
-        stmt = select(User).where(User.id == user_id)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_USER_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
     
     async def create_user(self, user_data: UserRegister) -> User:
@@ -76,30 +69,35 @@ class UserService:
         Raises:
             HTTPException: If email already exists
         """
-        # Check if email already exists
-        existing_user = await self.get_user_by_email(user_data.email)
-        if existing_user:
+        # Hash the password
+        hashed_password = await PasswordManager.hash_password_async(user_data.password)
+        
+        # Insert in a single atomic round-trip - the unique email index rejects
+        # duplicates, so there's no separate SELECT and no race between two
+        # concurrent registrations for the same email
+        stmt = (
+            pg_insert(User)
+            .values(
+                email=user_data.email,
+                hashed_password=hashed_password,
+                full_name=user_data.full_name,
+                is_active=True,
+                is_superuser=False
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        db_user = result.scalar_one_or_none()
+        
+        # No row returned means the email was already taken
+        if db_user is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
-        # Hash the password
-        hashed_password = PasswordManager.hash_password(user_data.password)
-        
-        # Create new user
-        db_user = User(
-            email=user_data.email,
-            hashed_password=hashed_password,
-            full_name=user_data.full_name,
-            is_active=True,
-            is_superuser=False
-        )
-        
-        # Add to database
-        self.db.add(db_user)
         await self.db.commit()
-        await self.db.refresh(db_user)
         
         return db_user
     
@@ -114,20 +112,22 @@ class UserService:
         Returns:
             User object if authentication successful, None otherwise
         """
-        # Find user by email
-        user = await self.get_user_by_email(email)
-        if not user:
+        # Fetch only what's needed to check the credentials - the full User
+        # is loaded only once the password has been verified
+        result = await self.db.execute(_CREDENTIALS_BY_EMAIL, {"email": email})
+        credentials = result.one_or_none()
+        if not credentials:
             return None
         
         # Check if user is active
-        if not user.is_active:
+        if not credentials.is_active:
             return None
         
         # Verify password
-        if not PasswordManager.verify_password(password, user.hashed_password):
+        if not await PasswordManager.verify_password_async(password, credentials.hashed_password):
             return None
         
-        return user
+        return await self.get_user_by_id(credentials.id)
     
     async def login_user(self, login_data: UserLogin) -> dict:
         """
@@ -173,29 +173,49 @@ class UserService:
             True if password changed successfully
             
         Raises:
-            HTTPException: If current password is wrong or user not found
+            HTTPException: If current password is wrong, user not found,
+                or the password was changed by another request meanwhile
         """
-        # Get user
-        user = await self.get_user_by_id(user_id)
-        if not user:
+        # Only the stored hash is needed to check the current password
+        result = await self.db.execute(_HASH_BY_ID, {"user_id": user_id})
+        current_hash = result.scalar_one_or_none()
+        if current_hash is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
         # Verify current password
-        if not PasswordManager.verify_password(password_data.current_password, user.hashed_password):
+        if not await PasswordManager.verify_password_async(password_data.current_password, current_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect"
             )
         
         # Hash new password
-        new_hashed_password = PasswordManager.hash_password(password_data.new_password)
+        new_hashed_password = await PasswordManager.hash_password_async(password_data.new_password)
         
-        # Update password
-        user.hashed_password = new_hashed_password
-        user.updated_at = datetime.now(timezone.utc)
+        # Update password - matching on the old hash too means a password that was
+        # changed concurrently (after we verified it) isn't silently overwritten
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.hashed_password == current_hash)
+            .values(hashed_password=new_hashed_password, updated_at=func.now())
+            .returning(User.id)
+        )
+        result = await self.db.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            # Nothing matched - find out whether the user is gone or the hash changed
+            result = await self.db.execute(_HASH_BY_ID, {"user_id": user_id})
+            if result.scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Password was changed concurrently"
+            )
         
         await self.db.commit()
         return True
@@ -210,16 +230,20 @@ class UserService:
         Returns:
             True if deactivated successfully
         """
-        user = await self.get_user_by_id(user_id)
-        if not user:
+        # Single UPDATE ... RETURNING instead of load-then-update
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=False, updated_at=func.now())
+            .returning(User.id)
+        )
+        result = await self.db.execute(stmt)
+        if result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        user.is_active = False
-        user.updated_at = datetime.now(timezone.utc)
-        
         await self.db.commit()
         return True
     
@@ -234,20 +258,21 @@ class UserService:
         Returns:
             Updated user object
         """
-        user = await self.get_user_by_id(user_id)
+        values = {"updated_at": func.now()}
+        if full_name is not None:
+            values["full_name"] = full_name
+        
+        # Single UPDATE ... RETURNING gives back the updated user in one round-trip
+        stmt = update(User).where(User.id == user_id).values(**values).returning(User)
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        if full_name is not None:
-            user.full_name = full_name
-        
-        user.updated_at = datetime.now(timezone.utc)
-        
         await self.db.commit()
-        await self.db.refresh(user)
         
         return user
 
@@ -45,7 +45,9 @@ CREATE TABLE IF NOT EXISTS api_keys (
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
-CREATE INDEX IF NOT EXISTS idx_projects_owner_id ON projects(owner_id);
+-- owner_id lookups are served by the UNIQUE(owner_id, name) index;
+-- this one covers "list my projects, newest first"
+CREATE INDEX IF NOT EXISTS idx_projects_owner_created ON projects(owner_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_api_keys_project_id ON api_keys(project_id);
 CREATE INDEX IF NOT EXISTS idx_api_keys_hash ON api_keys(key_hash);
 